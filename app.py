@@ -1,192 +1,501 @@
 import streamlit as st
 import pandas as pd
+from datetime import date, timedelta
+import hashlib
 import os
 import io
 import json
-from client import get_data
+import time
 from dotenv import load_dotenv
 
-# Load existing .env if available to pre-fill
-load_dotenv(override=True)
+# client (and through it the MCP SDK + llm_service) is imported lazily inside
+# the fetch helpers below, so the Credentials page and cold start don't pay
+# for it.
+
+# Load existing .env if available to pre-fill. cache_resource makes this a
+# once-per-process call instead of re-parsing the .env file on every rerun.
+@st.cache_resource(show_spinner=False)
+def _load_env():
+    load_dotenv(override=True)
+    return True
+
+_load_env()
+
+# Read once at import; these don't change while the app is running and the
+# Save handler shouldn't hit os.environ on every click.
+GROQ_API_KEY_ENV = os.getenv("GROQ_API_KEY", "")
+GROQ_MODEL_ENV = os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
 
 st.set_page_config(page_title="Timesheet Generator", layout="wide")
 
-# Initialize Session State
-if 'credentials' not in st.session_state:
-    st.session_state['credentials'] = {
-        "GITHUB_TOKEN": os.getenv("GITHUB_TOKEN", ""),
-        "GITHUB_USERNAME": os.getenv("GITHUB_OWNER", ""), # client.py expects GITHUB_USERNAME logic or config uses GITHUB_OWNER
-        "JIRA_URL": os.getenv("JIRA_URL", ""),
-        "JIRA_EMAIL": os.getenv("JIRA_EMAIL", ""),
-        "JIRA_API_TOKEN": os.getenv("JIRA_API_TOKEN", ""),
-        "JIRA_PROJECT_KEY": os.getenv("JIRA_PROJECT_KEY", ""),
-        # Prodapt Details
-        "EMPLOYEE_ID": "",
-        "EMPLOYEE_NAME": "",
-        "BILLABLE": "Yes",
-        "ROLE": "Developer",
-        "SITE": "Offshore",
-        "AUTHORIZED_HOURS": "8",
-        "ACTIVITY_PROCESS_TRANSACTION": os.getenv("ACTIVITY_PROCESS_TRANSACTION", "Development"),
-        "AUTHORIZED_UNITS": os.getenv("AUTHORIZED_UNITS", "1"),
-        "UOM": os.getenv("UOM", "Hours"),
-        "LOCATION": os.getenv("LOCATION", "Chennai - Guindy"),
-        "WORK_ITEM": os.getenv("WORK_ITEM", "General"),
-        "ANALYSIS_CODE": os.getenv("ANALYSIS_CODE", "N/A"),
-        "BOOKED_HOURS": os.getenv("BOOKED_HOURS", "8"),
-        "BOOKED_UNITS": os.getenv("BOOKED_UNITS", "1"),
-        "PLANNED_HOURS": os.getenv("PLANNED_HOURS", "8"),
-        "BALANCE_HOURS": os.getenv("BALANCE_HOURS", "0")
+# Only these credential fields affect what get_data fetches; render-only
+# fields (Employee ID, Billable, Role, Site, booking defaults, ...) are
+# broadcast onto the DataFrame after the fetch, so editing them must not
+# invalidate the cache. EMPLOYEE_NAME and AUTHORIZED_HOURS stay in the key
+# because client.py uses them for worklog matching and hour defaults.
+FETCH_CRED_KEYS = (
+    "GITHUB_TOKEN", "GITHUB_USERNAME",
+    "JIRA_URL", "JIRA_EMAIL", "JIRA_API_TOKEN", "JIRA_PROJECT_KEY",
+    "EMPLOYEE_NAME", "AUTHORIZED_HOURS",
+)
+
+# On-disk cache so a server restart or a fresh session can still skip the
+# Jira+GitHub fetch. Sits underneath st.cache_data.
+DISK_CACHE_DIR = ".cache"
+DISK_CACHE_TTL = 12 * 3600
+
+def _disk_cache_path(creds_key, start_date, end_date):
+    raw = json.dumps([list(creds_key), str(start_date), str(end_date)], sort_keys=True)
+    digest = hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(DISK_CACHE_DIR, f"timesheet_{digest}.json")
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def fetch_timesheet_cached(creds_key, _creds, start_date, end_date):
+    # creds_key is a digest of the fetch-relevant fields, so raw tokens never
+    # become cache keys; _creds (underscore = unhashed by Streamlit) carries
+    # the actual values down to get_data.
+    cache_path = _disk_cache_path(creds_key, start_date, end_date)
+    try:
+        if os.path.exists(cache_path) and time.time() - os.path.getmtime(cache_path) < DISK_CACHE_TTL:
+            with open(cache_path, "r") as f:
+                return json.load(f)
+    except Exception:
+        pass  # Corrupt/unreadable cache entry; fall through to a fresh fetch
+
+    from client import get_data  # deferred; Python caches the module
+    data = get_data(dict(_creds), start_date=start_date, end_date=end_date)
+
+    try:
+        os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump(data, f)
+    except Exception:
+        pass  # Cache write failures shouldn't break generation
+    return data
+
+@st.cache_data(ttl=600, show_spinner=False)
+def cached_insights(start, end):
+    # Insights only read the local logs/ directory, so (start, end) is the
+    # whole cache key; a short TTL picks up freshly written logs.
+    from client import generate_productivity_insights
+    return generate_productivity_insights(start, end)
+
+@st.cache_data(show_spinner=False)
+def insights_json(insights):
+    # Serialized once per insights dict; reruns reuse the cached string
+    return json.dumps(insights, indent=2)
+
+def build_insights_series(insights):
+    # Series for the charts/tables on the Insights page, built once when
+    # insights arrive instead of on every rerun of the render block.
+    return {
+        'commits_per_day': pd.Series(insights['commit_metrics']['commits_per_day'], name="Commits"),
+        'commits_per_repo': pd.Series(insights['commit_metrics']['commits_per_repo'], name="Commits"),
+        'project_distribution': pd.Series(insights['distribution']['project_distribution_percent'], name="%"),
+        'repo_distribution': pd.Series(insights['distribution']['repo_distribution_percent'], name="%"),
     }
 
+@st.cache_data(show_spinner=False)
+def to_csv_bytes(df):
+    # Memoized on the DataFrame hash so reruns don't re-serialize.
+    # pyarrow's CSV writer streams UTF-8 from C++ instead of pandas'
+    # Python-level string formatting.
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        buf = pa.BufferOutputStream()
+        pacsv.write_csv(table, buf)
+        return buf.getvalue().to_pybytes()
+    except Exception:
+        # pyarrow unavailable or a column it can't convert; pandas still works.
+        # Write straight into a bytes buffer instead of building the whole CSV
+        # as a str and then copying it again through .encode().
+        buf = io.BytesIO()
+        wrapper = io.TextIOWrapper(buf, encoding='utf-8', newline='')
+        df.to_csv(wrapper, index=False)
+        wrapper.flush()
+        return buf.getvalue()
+
+@st.cache_data(show_spinner=False)
+def to_xlsx_bytes(df):
+    buffer = io.BytesIO()
+    # xlsxwriter streams rows straight to the zipped XML instead of building
+    # openpyxl's per-cell object graph; constant_memory flushes each row as
+    # it's written so peak memory stays flat regardless of sheet size.
+    with pd.ExcelWriter(buffer, engine='xlsxwriter',
+                        engine_kwargs={'options': {'constant_memory': True}}) as writer:
+        df.to_excel(writer, index=False, sheet_name='Timesheet')
+
+        # Auto-adjust column width (optional polish)
+        # Constant/category columns (most of the timesheet) only need one
+        # len(); variable columns get the vectorized str.len() reduction.
+        worksheet = writer.sheets['Timesheet']
+        for i, col in enumerate(df.columns):
+            s = df[col]
+            if len(s) == 0:
+                data_len = 0
+            elif s.dtype.name == 'category' or s.nunique(dropna=False) <= 1:
+                data_len = len(str(s.iloc[0]))
+            else:
+                data_len = int(s.astype(str).str.len().max() or 0)
+            length = max(data_len, len(str(col)))
+            if length > 50: length = 50 # Cap width
+            worksheet.set_column(i, i, length + 2)
+    return buffer.getvalue()
+
+def inject_css(css):
+    # st.html (Streamlit >= 1.36) skips the markdown render pipeline for raw
+    # CSS. The CSS still has to be emitted on every run — Streamlit clears
+    # elements that aren't re-rendered, so a session-state "inject once"
+    # guard would drop the styling on the next rerun.
+    if hasattr(st, "html"):
+        st.html(css)
+    else:
+        st.markdown(css, unsafe_allow_html=True)
+
+# Static CSS for the sidebar navigation radio; built once at import.
+SIDEBAR_CSS = """
+<style>
+.stRadio > div[role="radiogroup"] > label {
+    background-color: transparent;
+    border: 1px solid rgba(128, 128, 128, 0.2);
+    border-radius: 8px;
+    padding: 10px;
+    text-align: center;
+    display: flex;
+    justify-content: center;
+    margin-bottom: 5px;
+}
+.stRadio > div[role="radiogroup"] > label[data-checked="true"] {
+    background-color: rgba(255, 75, 75, 0.1);
+    border-color: #FF4B4B;
+}
+</style>
+"""
+
+# Static CSS for the preview section; built once at import instead of from an
+# inline literal on every rerun.
+PREVIEW_CSS = """
+<style>
+/* Prevent body/main from horizontal scrolling */
+.stApp {
+    overflow-x: hidden;
+}
+/* Fix for Date Picker Range Highlighting */
+div[data-baseweb="calendar"] div[aria-selected="true"] {
+    background-color: #FF4B4B !important;
+    color: white !important;
+}
+</style>
+"""
+
+# Final display order for the timesheet table
+FINAL_COLUMN_ORDER = (
+    "Employee ID", "Employee Name", "Date", "Project",
+    "Activity / Process / Transaction", "Task", "Task Description",
+    "Authorized Hours", "Authorized Units", "UOM", "Billable", "Site",
+    "Role", "Location", "Work Item", "Analysis Code", "Remarks", "Status",
+    "Booked Hours", "Booked Units", "Planned Hours", "Balance Hours",
+)
+
+# Credentials defaults live at module scope so the init block below doesn't
+# re-evaluate a 25-entry literal. Env-backed fields map credential key ->
+# (env var, default); GITHUB_USERNAME reads GITHUB_OWNER to match config.py.
+CREDENTIAL_ENV_DEFAULTS = {
+    "GITHUB_TOKEN": ("GITHUB_TOKEN", ""),
+    "GITHUB_USERNAME": ("GITHUB_OWNER", ""),
+    "JIRA_URL": ("JIRA_URL", ""),
+    "JIRA_EMAIL": ("JIRA_EMAIL", ""),
+    "JIRA_API_TOKEN": ("JIRA_API_TOKEN", ""),
+    "JIRA_PROJECT_KEY": ("JIRA_PROJECT_KEY", ""),
+    "ACTIVITY_PROCESS_TRANSACTION": ("ACTIVITY_PROCESS_TRANSACTION", "Development"),
+    "AUTHORIZED_UNITS": ("AUTHORIZED_UNITS", "1"),
+    "UOM": ("UOM", "Hours"),
+    "LOCATION": ("LOCATION", "Chennai - Guindy"),
+    "WORK_ITEM": ("WORK_ITEM", "General"),
+    "ANALYSIS_CODE": ("ANALYSIS_CODE", "N/A"),
+    "BOOKED_HOURS": ("BOOKED_HOURS", "8"),
+    "BOOKED_UNITS": ("BOOKED_UNITS", "1"),
+    "PLANNED_HOURS": ("PLANNED_HOURS", "8"),
+    "BALANCE_HOURS": ("BALANCE_HOURS", "0"),
+}
+
+# Prodapt Details without an env-var counterpart
+DEFAULT_CREDS = {
+    "EMPLOYEE_ID": "",
+    "EMPLOYEE_NAME": "",
+    "BILLABLE": "Yes",
+    "ROLE": "Developer",
+    "SITE": "Offshore",
+    "AUTHORIZED_HOURS": "8",
+}
+
+ALL_CRED_KEYS = tuple(DEFAULT_CREDS) + tuple(CREDENTIAL_ENV_DEFAULTS)
+
+# Fields that must be present before a fetch is attempted
+REQUIRED_CRED_KEYS = ("JIRA_API_TOKEN", "GITHUB_TOKEN", "JIRA_PROJECT_KEY", "GITHUB_USERNAME")
+
+# Initialize Session State
+# Each credential is a flat session_state key so the form widgets bind to it
+# directly via key= and Streamlit handles storage — no Save-time copy of a
+# 20-entry dict.
+if '_creds_initialized' not in st.session_state:
+    for k, default in DEFAULT_CREDS.items():
+        st.session_state.setdefault(k, default)
+    for k, (env, default) in CREDENTIAL_ENV_DEFAULTS.items():
+        st.session_state.setdefault(k, os.getenv(env, default))
+    st.session_state['_creds_initialized'] = True
+
+def get_credentials():
+    """Snapshot of the credential fields (plus LLM config) for client.py."""
+    creds = {k: st.session_state.get(k, "") for k in ALL_CRED_KEYS}
+    creds["GROQ_API_KEY"] = GROQ_API_KEY_ENV
+    creds["GROQ_MODEL"] = GROQ_MODEL_ENV
+    return creds
+
 if 'timesheet_df' not in st.session_state:
     st.session_state['timesheet_df'] = None
 
+@st.cache_data(show_spinner=False)
+def date_range_bounds(today):
+    """
+    Preset ranges plus their display strings for the date tabs. Keyed on
+    today's date, so it's computed once per day instead of on every rerun.
+    """
+    this_week_start = today - timedelta(days=today.weekday())
+    last_week_start = this_week_start - timedelta(days=7)
+    last_week_end = this_week_start - timedelta(days=1)
+    this_month_start = today.replace(day=1)
+    return {
+        "today": today, "today_s": today.strftime('%d-%m-%Y'),
+        "tw": this_week_start, "tw_s": this_week_start.strftime('%d-%m-%Y'),
+        "lw_start": last_week_start, "lw_start_s": last_week_start.strftime('%d-%m-%Y'),
+        "lw_end": last_week_end, "lw_end_s": last_week_end.strftime('%d-%m-%Y'),
+        "tm": this_month_start, "tm_s": this_month_start.strftime('%d-%m-%Y'),
+    }
+
+def render_date_range_tabs(action_label, key_prefix):
+    """
+    Shared date-range tab block for the Dashboard and Insights pages.
+    Returns (start_date, end_date) when one of the buttons was clicked,
+    otherwise (None, None). Kept as a plain function rather than a fragment:
+    the button click has to trigger the caller's fetch logic, which lives
+    outside this block.
+    """
+    bounds = date_range_bounds(date.today())
+    today = bounds["today"]
+
+    tab1, tab2, tab3, tab4 = st.tabs(["This Week", "Last Week", "This Month", "Custom Range"])
+
+    start_date = None
+    end_date = None
+
+    with tab1:
+        st.write(f"**This Week:** {bounds['tw_s']} to {bounds['today_s']}")
+        if st.button(action_label, key=f"btn_{key_prefix}_tw"):
+            start_date, end_date = bounds["tw"], today
+
+    with tab2:
+        st.write(f"**Last Week:** {bounds['lw_start_s']} to {bounds['lw_end_s']}")
+        if st.button(action_label, key=f"btn_{key_prefix}_lw"):
+            start_date, end_date = bounds["lw_start"], bounds["lw_end"]
+
+    with tab3:
+        st.write(f"**This Month:** {bounds['tm_s']} to {bounds['today_s']}")
+        if st.button(action_label, key=f"btn_{key_prefix}_tm"):
+            start_date, end_date = bounds["tm"], today
+
+    with tab4:
+        date_range = st.date_input(
+            "Select Custom Date Range",
+            value=(today - timedelta(days=5), today),
+            max_value=today,
+            format="DD/MM/YYYY",
+            key=f"date_{key_prefix}_custom"
+        )
+        if st.button(action_label, key=f"btn_{key_prefix}_custom"):
+            if isinstance(date_range, tuple):
+                if len(date_range) == 2:
+                    start_date, end_date = date_range[0], date_range[1]
+                elif len(date_range) == 1:
+                    start_date = end_date = date_range[0]
+            else:
+                start_date = end_date = date_range
+
+    return start_date, end_date
+
+# Editor settings are static; build them once at import instead of per rerun.
+EDITABLE_COLS = ["Task", "Task Description", "Status", "Remarks"]
+EDITOR_COLUMN_CONFIG = {
+    "Task Description": st.column_config.TextColumn("Task Description", width="large"),
+    "Remarks": st.column_config.TextColumn("Remarks", width="large"),
+    "Task": st.column_config.TextColumn("Task", width="medium"),
+    "Date": st.column_config.TextColumn("Date", width="small")
+}
+
+def render_timesheet_preview():
+    """Preview + column filter + editor + downloads for the generated timesheet."""
+    st.markdown("### Timesheet Preview")
+
+    # --- Column Selection ---
+    df = st.session_state['timesheet_df']
+    all_columns = list(df.columns)
+
+    # Use st.popover for a cleaner "dropdown-like" UI with checkboxes
+    # Requires Streamlit >= 1.33.0
+    try:
+         # Using a funnel/filter icon often represented by :material/filter_alt: or similar in new streamlit
+         # Funnel icon: :material/filter_list:
+         filter_container = st.popover("Filter Columns", icon=":material/filter_alt:")
+    except AttributeError:
+         # Fallback for older Streamlit versions
+         filter_container = st.expander("Filter Columns")
+
+    with filter_container:
+        # One multiselect widget instead of 20+ checkboxes — a single
+        # widget round-trip per rerun instead of one per column.
+        selected_columns = st.multiselect(
+            "Visible columns",
+            options=all_columns,
+            default=all_columns,
+            key="visible_columns",
+            label_visibility="collapsed"
+        )
+
+    if selected_columns:
+        display_df = df[selected_columns]
+    else:
+        st.warning("No columns selected! Showing all columns.")
+        display_df = df
+
+    # Custom CSS for layout isolation
+    inject_css(PREVIEW_CSS)
+
+    st.info("💡 You can edit Task, Task Description, Status, and Remarks directly in the table below. Remember to save changes before exporting!")
+
+    # Set up editable columns and container
+    disabled_cols = [col for col in display_df.columns if col not in EDITABLE_COLS]
+
+    with st.container():
+        edited_df = st.data_editor(
+            display_df,
+            height=450,
+            hide_index=True,
+            disabled=disabled_cols,
+            column_config=EDITOR_COLUMN_CONFIG,
+            use_container_width=True,
+            key="timesheet_editor"
+        )
+
+    if st.button("💾 Save Changes", type="primary"):
+        # Only the editable columns can differ, so assign those directly
+        # instead of DataFrame.update, which realigns and copies every column.
+        full = st.session_state['timesheet_df']
+        for col in EDITABLE_COLS:
+            if col in edited_df.columns:
+                full.loc[edited_df.index, col] = edited_df[col].values
+        st.success("Changes preserved in session state successfully!")
+
+    st.markdown("---")
+
+    col1, col2 = st.columns(2)
+
+    # One stamp for both download filenames
+    stamp = date.today().strftime('%Y%m%d')
+
+    with col1:
+        st.download_button(
+            label="📄 Download as CSV",
+            data=to_csv_bytes(display_df),
+            file_name=f"timesheet_{stamp}.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
+
+    with col2:
+        st.download_button(
+            label="📊 Download as Excel",
+            data=to_xlsx_bytes(display_df),
+            file_name=f"timesheet_{stamp}.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            use_container_width=True
+        )
+
+# Scope preview interactions (column filter, editor, downloads) to the
+# fragment so they don't rerun the whole page. Requires Streamlit >= 1.37;
+# fall back to a plain function (full rerun) on older versions.
+if hasattr(st, "fragment"):
+    render_timesheet_preview = st.fragment(render_timesheet_preview)
+elif hasattr(st, "experimental_fragment"):
+    render_timesheet_preview = st.experimental_fragment(render_timesheet_preview)
+
 # Sidebar Navigation
 with st.sidebar:
-    st.markdown("""
-        <style>
-        .stRadio > div[role="radiogroup"] > label {
-            background-color: transparent;
-            border: 1px solid rgba(128, 128, 128, 0.2);
-            border-radius: 8px;
-            padding: 10px;
-            text-align: center;
-            display: flex;
-            justify-content: center;
-            margin-bottom: 5px;
-        }
-        .stRadio > div[role="radiogroup"] > label[data-checked="true"] {
-            background-color: rgba(255, 75, 75, 0.1);
-            border-color: #FF4B4B;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    inject_css(SIDEBAR_CSS)
     page = st.radio("Navigation", ["Dashboard", "Productivity Insights", "Credentials"], label_visibility="collapsed")
 
 if page == "Credentials":
     st.header("Configuration")
-    
+
+    # Widgets bind straight to session_state via key=, so edits persist
+    # without a Save-time copy of the whole credentials dict.
     with st.expander("GitHub Credentials", expanded=True):
-        gh_token = st.text_input("GitHub Token", value=st.session_state['credentials']['GITHUB_TOKEN'], type="password")
-        gh_user = st.text_input("GitHub Username", value=st.session_state['credentials']['GITHUB_USERNAME'])
+        st.text_input("GitHub Token", key="GITHUB_TOKEN", type="password")
+        st.text_input("GitHub Username", key="GITHUB_USERNAME")
 
     with st.expander("Jira Credentials", expanded=True):
-        jira_url = st.text_input("Jira URL", value=st.session_state['credentials']['JIRA_URL'])
-        jira_email = st.text_input("Jira Email", value=st.session_state['credentials']['JIRA_EMAIL'])
-        jira_token = st.text_input("Jira API Token", value=st.session_state['credentials']['JIRA_API_TOKEN'], type="password")
-        jira_proj = st.text_input("Jira Project Key", value=st.session_state['credentials']['JIRA_PROJECT_KEY'])
+        st.text_input("Jira URL", key="JIRA_URL")
+        st.text_input("Jira Email", key="JIRA_EMAIL")
+        st.text_input("Jira API Token", key="JIRA_API_TOKEN", type="password")
+        st.text_input("Jira Project Key", key="JIRA_PROJECT_KEY")
 
     with st.expander("Prodapt Details", expanded=True):
         col1, col2 = st.columns(2)
         with col1:
-            emp_id = st.text_input("Employee ID", value=st.session_state['credentials']['EMPLOYEE_ID'])
-            emp_name = st.text_input("Employee Name", value=st.session_state['credentials']['EMPLOYEE_NAME'])
-            billable = st.selectbox("Billable", ["Yes", "No"], index=0 if st.session_state['credentials']['BILLABLE'] == "Yes" else 1)
-            role = st.text_input("Role", value=st.session_state['credentials']['ROLE'])
-            site = st.selectbox("Site", ["Onshore", "Offshore"], index=1 if st.session_state['credentials']['SITE'] == "Offshore" else 0)
-            auth_hours = st.text_input("Authorized Hours", value=st.session_state['credentials']['AUTHORIZED_HOURS'])
-            auth_units = st.text_input("Authorized Units", value=st.session_state['credentials'].get('AUTHORIZED_UNITS', ''))
-            uom = st.text_input("UOM", value=st.session_state['credentials'].get('UOM', ''))
+            st.text_input("Employee ID", key="EMPLOYEE_ID")
+            st.text_input("Employee Name", key="EMPLOYEE_NAME")
+            st.selectbox("Billable", ["Yes", "No"], key="BILLABLE")
+            st.text_input("Role", key="ROLE")
+            st.selectbox("Site", ["Onshore", "Offshore"], key="SITE")
+            st.text_input("Authorized Hours", key="AUTHORIZED_HOURS")
+            st.text_input("Authorized Units", key="AUTHORIZED_UNITS")
+            st.text_input("UOM", key="UOM")
 
         with col2:
-            activity_proc = st.text_input("Activity / Process / Transaction", value=st.session_state['credentials'].get('ACTIVITY_PROCESS_TRANSACTION', ''))
-            location = st.text_input("Location", value=st.session_state['credentials'].get('LOCATION', ''))
-            work_item = st.text_input("Work Item", value=st.session_state['credentials'].get('WORK_ITEM', ''))
-            analysis_code = st.text_input("Analysis Code", value=st.session_state['credentials'].get('ANALYSIS_CODE', ''))
-            booked_hours = st.text_input("Booked Hours", value=st.session_state['credentials'].get('BOOKED_HOURS', ''))
-            booked_units = st.text_input("Booked Units", value=st.session_state['credentials'].get('BOOKED_UNITS', ''))
-            planned_hours = st.text_input("Planned Hours", value=st.session_state['credentials'].get('PLANNED_HOURS', ''))
-            balance_hours = st.text_input("Balance Hours", value=st.session_state['credentials'].get('BALANCE_HOURS', ''))
+            st.text_input("Activity / Process / Transaction", key="ACTIVITY_PROCESS_TRANSACTION")
+            st.text_input("Location", key="LOCATION")
+            st.text_input("Work Item", key="WORK_ITEM")
+            st.text_input("Analysis Code", key="ANALYSIS_CODE")
+            st.text_input("Booked Hours", key="BOOKED_HOURS")
+            st.text_input("Booked Units", key="BOOKED_UNITS")
+            st.text_input("Planned Hours", key="PLANNED_HOURS")
+            st.text_input("Balance Hours", key="BALANCE_HOURS")
 
     if st.button("Save Configuration"):
-        st.session_state['credentials'].update({
-            "GITHUB_TOKEN": gh_token,
-            "GITHUB_USERNAME": gh_user,
-            "JIRA_URL": jira_url,
-            "JIRA_EMAIL": jira_email,
-            "JIRA_API_TOKEN": jira_token,
-            "JIRA_PROJECT_KEY": jira_proj,
-            "EMPLOYEE_ID": emp_id,
-            "EMPLOYEE_NAME": emp_name,
-            "BILLABLE": billable,
-            "ROLE": role,
-            "SITE": site,
-            "AUTHORIZED_HOURS": auth_hours,
-            "AUTHORIZED_UNITS": auth_units,
-            "UOM": uom,
-            "ACTIVITY_PROCESS_TRANSACTION": activity_proc,
-            "LOCATION": location,
-            "WORK_ITEM": work_item,
-            "ANALYSIS_CODE": analysis_code,
-            "BOOKED_HOURS": booked_hours,
-            "BOOKED_UNITS": booked_units,
-            "PLANNED_HOURS": planned_hours,
-            "BALANCE_HOURS": balance_hours,
-            # Pass other config vars required by mcp_server or llm_service
-            "GROQ_API_KEY": os.getenv("GROQ_API_KEY", ""),
-            "GROQ_MODEL": os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
-        })
+        # Nothing to copy — the key-bound widgets above already wrote their
+        # values into session_state.
         st.success("Credentials saved to session state!")
 
 elif page == "Dashboard":
     st.title("Timesheet Dashboard")
     
-    st.markdown("### Generate Timesheet")
     st.markdown("### Generate Timesheet")
     st.markdown("Fetch data based on your configuration and selected date range.")
 
     # Date Range Tabs
-    today = pd.Timestamp.now().date()
-    this_week_start = today - pd.Timedelta(days=today.weekday())
-    last_week_start = this_week_start - pd.Timedelta(days=7)
-    last_week_end = this_week_start - pd.Timedelta(days=1)
-    this_month_start = today.replace(day=1)
-
-    tab1, tab2, tab3, tab4 = st.tabs(["This Week", "Last Week", "This Month", "Custom Range"])
-    
-    start_date = None
-    end_date = None
+    start_date, end_date = render_date_range_tabs("Generate Timesheet", "db")
 
-    with tab1:
-        st.write(f"**This Week:** {this_week_start.strftime('%d-%m-%Y')} to {today.strftime('%d-%m-%Y')}")
-        if st.button("Generate Timesheet", key="btn_db_tw"):
-            start_date, end_date = this_week_start, today
-
-    with tab2:
-        st.write(f"**Last Week:** {last_week_start.strftime('%d-%m-%Y')} to {last_week_end.strftime('%d-%m-%Y')}")
-        if st.button("Generate Timesheet", key="btn_db_lw"):
-            start_date, end_date = last_week_start, last_week_end
-
-    with tab3:
-        st.write(f"**This Month:** {this_month_start.strftime('%d-%m-%Y')} to {today.strftime('%d-%m-%Y')}")
-        if st.button("Generate Timesheet", key="btn_db_tm"):
-            start_date, end_date = this_month_start, today
-
-    with tab4:
-        date_range = st.date_input(
-            "Select Custom Date Range",
-            value=(today - pd.Timedelta(days=5), today),
-            max_value=today,
-            format="DD/MM/YYYY"
-        )
-        if st.button("Generate Timesheet", key="btn_db_custom"):
-            if isinstance(date_range, tuple):
-                if len(date_range) == 2:
-                    start_date, end_date = date_range[0], date_range[1]
-                elif len(date_range) == 1:
-                    start_date = end_date = date_range[0]
-            else:
-                start_date = end_date = date_range
+    force_refresh = st.checkbox("Force refresh (ignore cached data)", key="force_refresh")
 
     if start_date and end_date:
-        creds = st.session_state['credentials']
-        
-        # Validation
-        if not creds.get("JIRA_API_TOKEN"):
-            st.error("Jira API Token is missing. Please configure it in the Credentials tab.")
-        elif not creds.get("GITHUB_TOKEN"):
-            st.error("GitHub Token is missing. Please configure it in the Credentials tab.")
+        creds = get_credentials()
+
+        # Validation: report every missing credential in one pass instead of
+        # one error per click-retry cycle.
+        missing = [k for k in REQUIRED_CRED_KEYS if not creds.get(k)]
+        if missing:
+            st.error(f"Missing credentials: {', '.join(missing)}. Please configure them in the Credentials tab.")
         else:
             with st.spinner(f"Fetching data from {start_date.strftime('%d-%m-%Y')} to {end_date.strftime('%d-%m-%Y')}..."):
                 try:
@@ -195,42 +504,93 @@ elif page == "Dashboard":
                     # client.py logic uses: project_key = credentials.get("JIRA_PROJECT_KEY")
                     # github_user = credentials.get("GITHUB_USERNAME")
                     
-                    data = get_data(creds, start_date=start_date, end_date=end_date)
+                    fetch_creds = tuple((k, creds.get(k, "")) for k in FETCH_CRED_KEYS)
+                    creds_key = hashlib.sha256(json.dumps(fetch_creds).encode("utf-8")).hexdigest()
+
+                    # Raw rows for this exact request also live in session
+                    # state, so repeat clicks skip even the cache lookup
+                    # (and survive a cache_data invalidation).
+                    raw_key = f"raw_{start_date}_{end_date}_{creds_key[:16]}"
+
+                    if force_refresh:
+                        # Drop all cache layers so the fetch really re-runs
+                        fetch_timesheet_cached.clear()
+                        st.session_state.pop(raw_key, None)
+                        try:
+                            os.remove(_disk_cache_path(creds_key, start_date, end_date))
+                        except OSError:
+                            pass
+
+                    data = st.session_state.get(raw_key)
+                    if data is None:
+                        data = fetch_timesheet_cached(creds_key, fetch_creds, start_date, end_date)
+                        st.session_state[raw_key] = data
                     
                     if not data:
                         st.warning("No activity found for the selected date range.")
                     else:
                         # Process data into desired columns
                         # Columns: Employee Id | Employee Name | Date | Project | Task | Task Description | Authorized Hours | Billable | Role | site | status | Remark
-                        
-                        colored_data = []
-                        for row in data:
-                            colored_data.append({
-                                "Employee ID": creds["EMPLOYEE_ID"],
-                                "Employee Name": creds["EMPLOYEE_NAME"],
-                                "Date": pd.to_datetime(row["Date"]).strftime('%d-%m-%Y'),
-                                "Project": row["Project"],
-                                "Activity / Process / Transaction": creds["ACTIVITY_PROCESS_TRANSACTION"],
-                                "Task": row["Task"],
-                                "Task Description": row["Task Description"],
-                                "Authorized Hours": creds["AUTHORIZED_HOURS"],
-                                "Authorized Units": creds["AUTHORIZED_UNITS"],
-                                "UOM": creds["UOM"],
-                                "Billable": creds["BILLABLE"],
-                                "Site": creds["SITE"],
-                                "Role": creds["ROLE"],
-                                "Location": creds["LOCATION"],
-                                "Work Item": creds["WORK_ITEM"],
-                                "Analysis Code": creds["ANALYSIS_CODE"],
-                                "Remarks": row["Remark"],
-                                "Status": row["Status"],
-                                "Booked Hours": creds["BOOKED_HOURS"],
-                                "Booked Units": creds["BOOKED_UNITS"],
-                                "Planned Hours": row.get("Planned Hours", creds["PLANNED_HOURS"]),
-                                "Balance Hours": row.get("Balance Hours", creds["BALANCE_HOURS"])
-                            })
-                        
-                        df = pd.DataFrame(colored_data)
+
+                        # Columnar construction: one DataFrame from the fetched rows,
+                        # then broadcast-assign the constant credential columns
+                        # instead of copying them into every row dict.
+                        base = pd.DataFrame(data)
+                        # Dates from client.py are always ISO; passing format= keeps
+                        # pandas on the fast C parser instead of dateutil fallback.
+                        base["Date"] = pd.to_datetime(base["Date"], format="%Y-%m-%d", errors="coerce").dt.strftime('%d-%m-%Y')
+                        base = base.rename(columns={"Remark": "Remarks"})
+
+                        # Pin the hours columns to float64 up front (the
+                        # credential fallbacks are env strings, and leaving
+                        # them to inference would keep the columns as object),
+                        # then backfill per-row gaps with one vectorized
+                        # fillna instead of per-row default lookups.
+                        for col, default in (("Planned Hours", creds["PLANNED_HOURS"]),
+                                             ("Balance Hours", creds["BALANCE_HOURS"])):
+                            default = pd.to_numeric(default, errors="coerce")
+                            if col not in base.columns:
+                                base[col] = default
+                            else:
+                                base[col] = pd.to_numeric(base[col], errors="coerce").fillna(default)
+
+                        # One creds lookup per column, bound once; assign
+                        # broadcasts each scalar across the frame.
+                        const_cols = {
+                            "Employee ID": creds["EMPLOYEE_ID"],
+                            "Employee Name": creds["EMPLOYEE_NAME"],
+                            "Activity / Process / Transaction": creds["ACTIVITY_PROCESS_TRANSACTION"],
+                            "Authorized Hours": creds["AUTHORIZED_HOURS"],
+                            "Authorized Units": creds["AUTHORIZED_UNITS"],
+                            "UOM": creds["UOM"],
+                            "Billable": creds["BILLABLE"],
+                            "Site": creds["SITE"],
+                            "Role": creds["ROLE"],
+                            "Location": creds["LOCATION"],
+                            "Work Item": creds["WORK_ITEM"],
+                            "Analysis Code": creds["ANALYSIS_CODE"],
+                            "Booked Hours": creds["BOOKED_HOURS"],
+                            "Booked Units": creds["BOOKED_UNITS"]
+                        }
+                        base = base.assign(**const_cols)
+
+                        # Constant columns as category: one code array + a
+                        # single-entry index instead of N object references.
+                        # Status stays object dtype — it's editable in the
+                        # preview and categories would reject new values.
+                        for c in const_cols:
+                            base[c] = base[c].astype("category")
+
+                        # Variable text columns as Arrow-backed strings: no
+                        # per-cell Python object, and cheaper Arrow
+                        # serialization to the frontend.
+                        try:
+                            for c in ("Date", "Project", "Task", "Task Description", "Status", "Remarks"):
+                                base[c] = base[c].astype("string[pyarrow]")
+                        except (ImportError, TypeError):
+                            pass  # pyarrow-backed strings unavailable; object dtype still works
+
+                        df = base.reindex(columns=list(FINAL_COLUMN_ORDER))
                         st.session_state['timesheet_df'] = df
                         st.success("Timesheet generated successfully!")
                         
@@ -239,175 +599,38 @@ elif page == "Dashboard":
 
     # Display Data
     if st.session_state['timesheet_df'] is not None:
-        st.markdown("### Timesheet Preview")
-
-        # --- Column Selection ---
-        df = st.session_state['timesheet_df']
-        all_columns = list(df.columns)
-        
-        # Use st.popover for a cleaner "dropdown-like" UI with checkboxes
-        # Requires Streamlit >= 1.33.0
-        try:
-             # Using a funnel/filter icon often represented by :material/filter_alt: or similar in new streamlit
-             # Funnel icon: :material/filter_list:
-             filter_container = st.popover("Filter Columns", icon=":material/filter_alt:")
-        except AttributeError:
-             # Fallback for older Streamlit versions
-             filter_container = st.expander("Filter Columns")
-
-        selected_columns = []
-        with filter_container:
-            st.write("Uncheck to hide columns:")
-            for col in all_columns:
-                # Default to True (checked)
-                if st.checkbox(col, value=True, key=f"chk_{col}"):
-                    selected_columns.append(col)
-        
-        if selected_columns:
-            display_df = df[selected_columns]
-        else:
-            st.warning("No columns selected! Showing all columns.")
-            display_df = df
-
-        
-        # Custom CSS for layout isolation
-        st.markdown("""
-        <style>
-        /* Prevent body/main from horizontal scrolling */
-        .stApp {
-            overflow-x: hidden;
-        }
-        /* Fix for Date Picker Range Highlighting */
-        div[data-baseweb="calendar"] div[aria-selected="true"] {
-            background-color: #FF4B4B !important; 
-            color: white !important;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
-        st.info("💡 You can edit Task, Task Description, Status, and Remarks directly in the table below. Remember to save changes before exporting!")
-
-        # Set up editable columns and container
-        editable_cols = ["Task", "Task Description", "Status", "Remarks"]
-        disabled_cols = [col for col in display_df.columns if col not in editable_cols]
-        
-        column_configurations = {
-            "Task Description": st.column_config.TextColumn("Task Description", width="large"),
-            "Remarks": st.column_config.TextColumn("Remarks", width="large"),
-            "Task": st.column_config.TextColumn("Task", width="medium"),
-            "Date": st.column_config.TextColumn("Date", width="small")
-        }
-
-        with st.container():
-            edited_df = st.data_editor(
-                display_df,
-                height=450,
-                hide_index=True,
-                disabled=disabled_cols,
-                column_config=column_configurations,
-                use_container_width=False,
-                key="timesheet_editor"
-            )
-
-        if st.button("💾 Save Changes", type="primary"):
-            st.session_state['timesheet_df'].update(edited_df)
-            st.success("Changes preserved in session state successfully!")
-        
-        st.markdown("---")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            csv = display_df.to_csv(index=False).encode('utf-8')
-            st.download_button(
-                label="📄 Download as CSV",
-                data=csv,
-                file_name=f"timesheet_{pd.Timestamp.now().strftime('%Y%m%d')}.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
-            
-        with col2:
-            buffer = io.BytesIO()
-            with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-                display_df.to_excel(writer, index=False, sheet_name='Timesheet')
-                
-                # Auto-adjust column width (optional polish)
-                worksheet = writer.sheets['Timesheet']
-                for column_cells in worksheet.columns:
-                    length = max(len(str(cell.value)) for cell in column_cells)
-                    if length > 50: length = 50 # Cap width
-                    worksheet.column_dimensions[column_cells[0].column_letter].width = length + 2
-
-            st.download_button(
-                label="📊 Download as Excel",
-                data=buffer.getvalue(),
-                file_name=f"timesheet_{pd.Timestamp.now().strftime('%Y%m%d')}.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                use_container_width=True
-            )
+        render_timesheet_preview()
 
 elif page == "Productivity Insights":
     st.title("Productivity Insights")
     st.markdown("Analyze your productivity across Jira and GitHub based on historical logs.")
     
     # Date Range Tabs
-    today = pd.Timestamp.now().date()
-    this_week_start = today - pd.Timedelta(days=today.weekday())
-    last_week_start = this_week_start - pd.Timedelta(days=7)
-    last_week_end = this_week_start - pd.Timedelta(days=1)
-    this_month_start = today.replace(day=1)
-
-    tab1, tab2, tab3, tab4 = st.tabs(["This Week", "Last Week", "This Month", "Custom Range"])
-    
-    start_date = None
-    end_date = None
-
-    with tab1:
-        st.write(f"**This Week:** {this_week_start.strftime('%d-%m-%Y')} to {today.strftime('%d-%m-%Y')}")
-        if st.button("Generate Productivity Insights", key="btn_pi_tw"):
-            start_date, end_date = this_week_start, today
-
-    with tab2:
-        st.write(f"**Last Week:** {last_week_start.strftime('%d-%m-%Y')} to {last_week_end.strftime('%d-%m-%Y')}")
-        if st.button("Generate Productivity Insights", key="btn_pi_lw"):
-            start_date, end_date = last_week_start, last_week_end
-
-    with tab3:
-        st.write(f"**This Month:** {this_month_start.strftime('%d-%m-%Y')} to {today.strftime('%d-%m-%Y')}")
-        if st.button("Generate Productivity Insights", key="btn_pi_tm"):
-            start_date, end_date = this_month_start, today
+    start_date, end_date = render_date_range_tabs("Generate Productivity Insights", "pi")
 
-    with tab4:
-        date_range = st.date_input(
-            "Select Custom Date Range",
-            value=(today - pd.Timedelta(days=5), today),
-            max_value=today,
-            format="DD/MM/YYYY",
-            key="date_pi_custom"
-        )
-        if st.button("Generate Productivity Insights", key="btn_pi_custom"):
-            if isinstance(date_range, tuple):
-                if len(date_range) == 2:
-                    start_date, end_date = date_range[0], date_range[1]
-                elif len(date_range) == 1:
-                    start_date = end_date = date_range[0]
-            else:
-                start_date = end_date = date_range
+    if st.button("🔄 Refresh Insights", help="Discard cached insights and re-read the activity logs"):
+        cached_insights.clear()
+        st.session_state.pop('insights_data', None)
+        st.session_state.pop('insights_series', None)
 
     if start_date and end_date:
         with st.spinner(f"Analyzing logs from {start_date.strftime('%d-%m-%Y')} to {end_date.strftime('%d-%m-%Y')}..."):
             try:
-                from client import generate_productivity_insights
-                insights = generate_productivity_insights(str(start_date), str(end_date))
+                insights = cached_insights(str(start_date), str(end_date))
                 st.session_state['insights_data'] = insights
+                # Build the chart/table Series once here rather than on
+                # every rerun of the render block below.
+                st.session_state['insights_series'] = build_insights_series(insights)
                 st.success("Insights generated successfully!")
             except Exception as e:
                 st.error(f"An error occurred: {str(e)}")
 
     if 'insights_data' in st.session_state and st.session_state['insights_data']:
         insights = st.session_state['insights_data']
-        
+        series = st.session_state.get('insights_series')
+        if series is None:
+            series = st.session_state['insights_series'] = build_insights_series(insights)
+
         st.markdown("### Overview")
         col1, col2, col3, col4 = st.columns(4)
         col1.metric("Active Days", insights['consistency']['active_days'])
@@ -421,13 +644,13 @@ elif page == "Productivity Insights":
             st.markdown("#### Commit Metrics")
             commits_per_day = insights['commit_metrics']['commits_per_day']
             if sum(commits_per_day.values()) > 0:
-                st.bar_chart(pd.Series(commits_per_day, name="Commits"))
+                st.bar_chart(series['commits_per_day'])
             else:
                 st.info("No commits found in the selected range.")
                 
             st.markdown("#### Repositories")
             if insights['commit_metrics']['commits_per_repo']:
-                st.table(pd.Series(insights['commit_metrics']['commits_per_repo'], name="Commits"))
+                st.table(series['commits_per_repo'])
             else:
                 st.info("No repository activity found.")
             
@@ -439,13 +662,13 @@ elif page == "Productivity Insights":
             st.markdown("#### Work Distribution")
             st.write("**Projects (%):**")
             if insights['distribution']['project_distribution_percent']:
-                st.table(pd.Series(insights['distribution']['project_distribution_percent'], name="%"))
+                st.table(series['project_distribution'])
             else:
                 st.info("No Jira projects touched.")
             
             st.write("**Repos (%):**")
             if insights['distribution']['repo_distribution_percent']:
-                st.table(pd.Series(insights['distribution']['repo_distribution_percent'], name="%"))
+                st.table(series['repo_distribution'])
             else:
                 st.info("No Github repos touched.")
             
@@ -454,7 +677,7 @@ elif page == "Productivity Insights":
         st.write(f"- **Context Switching Days** (> 2 projects/repos modified): {insights['consistency']['context_switching_days']}")
         
         st.markdown("---")
-        json_str = json.dumps(insights, indent=2)
+        json_str = insights_json(insights)
         st.download_button(
             label="📄 Download Insights (JSON)",
             data=json_str,
@@ -1,31 +1,39 @@
 import asyncio
+import functools
 import os
 import sys
 import json
-from datetime import datetime, timedelta
+import re
+import threading
+from datetime import date as date_type, datetime, timedelta
 import config
-from llm_service import summarize_activity
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+try:
+    import orjson  # C-level JSON codec for logs and tool payloads
+except ImportError:
+    orjson = None
+
+# Both raise a ValueError subclass on bad input, so call sites catch that.
+_loads = orjson.loads if orjson is not None else json.loads
+
 def get_dates_in_range(start_date, end_date):
     """
     Returns a list of date strings (YYYY-MM-DD) between start_date and end_date (inclusive).
     start_date and end_date can be datetime objects or strings.
     """
-    if isinstance(start_date,  str):
-        start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
+    # fromisoformat/isoformat are C-accelerated; strptime/strftime would
+    # re-process the format string on every call.
+    if isinstance(start_date, str):
+        start_date = date_type.fromisoformat(start_date)
     # Handle pandas timestamp or other date objects if needed, assuming date objects for now based on app.py
-    
+
     if isinstance(end_date, str):
-         end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
+        end_date = date_type.fromisoformat(end_date)
 
     delta = (end_date - start_date).days
-    dates = []
-    for i in range(delta + 1):
-        day = start_date + timedelta(days=i)
-        dates.append(day.strftime("%Y-%m-%d"))
-    return dates
+    return [(start_date + timedelta(days=i)).isoformat() for i in range(delta + 1)]
 
 def aggregate_daily_logged_hours(jira_entries, target_date, current_user_name, current_user_email):
     """
@@ -58,195 +66,390 @@ def aggregate_daily_logged_hours(jira_entries, target_date, current_user_name, c
 
 
 
-async def fetch_timesheet_data(credentials, start_date, end_date):
+async def _fetch_jira_for_date(session, project_key, date):
     """
-    Fetches timesheet data using the provided credentials and date range.
+    Calls the get_jira_activity tool for one date.
+    Returns (parsed_entries: list, raw_content: str).
+    """
+    daily_jira_entries = []
+    jira_raw_content = ""
+    try:
+        jira_resp = await session.call_tool("get_jira_activity", arguments={
+            "project_key": project_key,
+            "date": date,
+            "fetch_worklogs": True
+        })
+        jira_raw_content = jira_resp.content[0].text
+
+        # Parse first and let failure classify the response: non-JSON
+        # payloads ("Error: ...", "No Jira activity ...") just fail the
+        # decode, so no substring scans over potentially large text.
+        try:
+            jira_entries = _loads(jira_raw_content)
+            if isinstance(jira_entries, list):
+                daily_jira_entries = jira_entries
+        except ValueError:
+            pass
+    except Exception as e:
+        jira_raw_content = f"Error: {str(e)}"
+    return daily_jira_entries, jira_raw_content
+
+async def _fetch_github_for_date(session, github_user, date):
+    """
+    Calls the get_github_activity tool for one date.
+    Returns (parsed_entries: list, raw_content: str).
+    """
+    daily_github_entries = []
+    github_raw_content = ""
+    try:
+        github_resp = await session.call_tool("get_github_activity", arguments={
+            "username": github_user,
+            "date": date
+        })
+        github_raw_content = github_resp.content[0].text
+
+        try:
+            github_entries = _loads(github_raw_content)
+            if isinstance(github_entries, list):
+                daily_github_entries = github_entries
+        except ValueError:
+            pass
+    except Exception as e:
+        github_raw_content = f"Error: {str(e)}"
+    return daily_github_entries, github_raw_content
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Task selection order: Done/Completed > In Progress > Others.
+_DONE_STATUSES = frozenset({"done", "completed", "verified", "closed", "resolved"})
+
+def _entry_priority(entry):
+    status = entry.get("status", "").lower()
+    if status in _DONE_STATUSES:
+        return 0
+    elif status == "in progress":
+        return 1
+    else:
+        return 2
+
+
+def _write_log(path, payload):
+    # Compact dump: these files are read back programmatically, and
+    # pretty-printing roughly doubles the serialization work.
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(payload))
+    else:
+        with open(path, "w") as f:
+            json.dump(payload, f)
+
+
+def _server_params(credentials):
+    """
+    Builds the StdioServerParameters for spawning mcp_server.py with the
+    given credentials injected into its environment.
     """
-    
-    # Prepare environment variables for the subprocess
     server_env = os.environ.copy()
     server_env.update(credentials)
 
-    # Define server parameters
-    server_params = StdioServerParameters(
-        command=sys.executable, 
+    return StdioServerParameters(
+        command=sys.executable,
         args=["mcp_server.py"],
         env=server_env
     )
 
+
+async def _collect_timesheet(session, credentials, start_date, end_date):
+    """
+    Runs the per-day collection loop against an already-initialized
+    MCP ClientSession and returns the timesheet rows.
+    """
+    # Deferred so importing client.py doesn't pull in the groq SDK;
+    # only actual timesheet generation needs the LLM.
+    from llm_service import summarize_activity
+
     timesheet_data = []
 
     # Ensure logs directory exists
     os.makedirs("logs", exist_ok=True)
 
-    async with stdio_client(server_params) as (read, write):
+    # Already ascending (oldest to newest) from get_dates_in_range.
+    dates = get_dates_in_range(start_date, end_date)
+
+    project_key = credentials.get("JIRA_PROJECT_KEY", "PROJ")
+    github_user = credentials.get("GITHUB_USERNAME", "user")
+
+    # --- Fetch Jira and GitHub Data concurrently ---
+    # All per-day tool calls are independent I/O, so issue them for every
+    # date at once instead of day by day; the semaphore keeps us from
+    # flooding the server with more than a few days in flight.
+    sem = asyncio.Semaphore(5)
+
+    async def _fetch_day(date):
+        async with sem:
+            return await asyncio.gather(
+                _fetch_jira_for_date(session, project_key, date),
+                _fetch_github_for_date(session, github_user, date)
+            )
+
+    day_results = await asyncio.gather(*(_fetch_day(date) for date in dates))
+
+    days = []
+    for date, ((daily_jira_entries, jira_raw_content),
+               (daily_github_entries, github_raw_content)) in zip(dates, day_results):
+        # --- Save Raw Data ---
+        # Written in a worker thread so file I/O doesn't stall the event
+        # loop while other days' tool calls are still in flight.
+        try:
+            await asyncio.to_thread(_write_log, f"logs/activity_{date}.json", {
+                "date": date,
+                "jira": daily_jira_entries,
+                "github": daily_github_entries,
+                "raw_jira_response": jira_raw_content,
+                "raw_github_response": github_raw_content
+            })
+        except Exception as e:
+            print(f"Failed to save log for {date}: {e}", file=sys.stderr)
+
+        # --- Select Best Task ---
+        selected_entry = None
+        if daily_jira_entries:
+            # min() is O(n) and only the best entry is used, so a full
+            # sort of the day's entries buys nothing.
+            selected_entry = min(daily_jira_entries, key=_entry_priority)
+
+        # --- Prepare LLM Context ---
+        # Token count drives both Groq cost and latency, so keep the
+        # context tight: a 200-char description with whitespace runs
+        # collapsed, and only the first five commit lines.
+        jira_context = ""
+        if selected_entry:
+            desc = _WHITESPACE.sub(" ", (selected_entry.get("description") or "")[:200]).strip()
+            jira_context = f"{selected_entry['key']}: {selected_entry['summary']}\nDescription: {desc}"
+
+        github_context = ""
+        if daily_github_entries:
+            github_context = "\n".join(f"- {i['summary']}" for i in daily_github_entries[:5])
+
+        days.append({
+            "date": date,
+            "jira_entries": daily_jira_entries,
+            "selected_entry": selected_entry,
+            "jira_context": jira_context,
+            "github_context": github_context,
+        })
+
+    # --- Generate Summaries concurrently ---
+    # summarize_activity is a blocking HTTP call to the LLM provider; run
+    # the per-day calls in worker threads so a multi-day range pays one
+    # round-trip of latency instead of one per day.
+    llm_sem = asyncio.Semaphore(4)
+
+    async def _summarize(day):
+        if not (day["selected_entry"] or day["github_context"]):
+            return ""
+        async with llm_sem:
+            return await asyncio.to_thread(
+                summarize_activity, day["jira_context"], day["github_context"], day["date"]
+            )
+
+    summaries = await asyncio.gather(*(_summarize(day) for day in days))
+
+    for day, daily_summary in zip(days, summaries):
+        date = day["date"]
+        daily_jira_entries = day["jira_entries"]
+        selected_entry = day["selected_entry"]
+        github_context = day["github_context"]
+
+        # --- Calculate Logged Hours ---
+        daily_logged_hours, has_worklogs = aggregate_daily_logged_hours(
+            daily_jira_entries, 
+            date, 
+            credentials.get("EMPLOYEE_NAME", ""), 
+            credentials.get("JIRA_EMAIL", "")
+        )
+
+        try:
+            default_hours = float(credentials.get("AUTHORIZED_HOURS", 8))
+        except (ValueError, TypeError):
+            default_hours = 8.0
+
+        if has_worklogs:
+            # Logged Hours (Jira Worklogs) override default
+            planned_hours = daily_logged_hours
+            balance_hours = max(0.0, default_hours - planned_hours)
+        else:
+            planned_hours = default_hours
+            balance_hours = 0.0
+
+        # --- Create Timesheet Row ---
+        if selected_entry:
+            timesheet_data.append({
+                "Date": date,
+                "Project": selected_entry.get("project", project_key),
+                "Task": selected_entry.get("summary"),
+                "Task Description": selected_entry.get("description", ""),
+                "Status": selected_entry.get("status"),
+                "Remark": daily_summary,
+                "Planned Hours": planned_hours,      # Logged Hours (Jira Worklogs)
+                "Balance Hours": balance_hours
+            })
+        elif github_context:
+            # Fallback if no Jira but GitHub activity exists
+            timesheet_data.append({
+                "Date": date,
+                "Project": "GitHub/General",
+                "Task": "General Development Activities",
+                "Task Description": "See Remarks for details.",
+                "Status": "Completed", 
+                "Remark": daily_summary,
+                "Planned Hours": planned_hours,      # Logged Hours (Jira Worklogs)
+                "Balance Hours": balance_hours
+            })
+        else:
+            # NO ACTIVITY FOUND
+            timesheet_data.append({
+                "Date": date,
+                "Project": "N/A",
+                "Task": "No activity",
+                "Task Description": "No Jira or GitHub activity found.",
+                "Status": "N/A",
+                "Remark": "No activity recorded.",
+                "Planned Hours": planned_hours,      # Logged Hours (Jira Worklogs)
+                "Balance Hours": balance_hours
+            })
+
+    return timesheet_data
+
+
+async def fetch_timesheet_data(credentials, start_date, end_date):
+    """
+    Fetches timesheet data using the provided credentials and date range.
+    Spawns a one-shot MCP server subprocess for the duration of the call.
+    """
+    async with stdio_client(_server_params(credentials)) as (read, write):
         async with ClientSession(read, write) as session:
             await session.initialize()
+            return await _collect_timesheet(session, credentials, start_date, end_date)
 
-            dates = get_dates_in_range(start_date, end_date)
-            dates.reverse() # Newest to oldest usually prefers, but loop can be distinct. 
-            # Actually, standard timesheet is usually chronological? 
-            # Existing code did: dates.reverse() # Oldest to newest?
-            # client.py L41: dates.reverse()
-            # L40 generated [today, today-1...]. so reverse makes it [today-4, ... today].
-            
-            # Let's process chronological (Oldest to Newest) so "In Progress" logic makes sense if we generated logs sequentially?
-            # Actually "find_last_in_progress_task" looks at *logs*.
-            # Processing order doesn't strictly matter for *generation* if we rely on stored logs, 
-            # BUT efficient carry-over might benefit from knowing the previous day.
-            # However, the requirement is to look back 5 days *from the empty day*.
-            # So regardless of processing order, we look at the file system.
-            
-            # We'll stick to Oldest -> Newest (Chronological)
-            dates.sort() 
-
-            project_key = credentials.get("JIRA_PROJECT_KEY", "PROJ")
-            github_user = credentials.get("GITHUB_USERNAME", "user")
-
-            for date in dates:
-                # --- Fetch Jira Data ---
-                daily_jira_entries = []
-                jira_raw_content = ""
-                try:
-                    jira_resp = await session.call_tool("get_jira_activity", arguments={
-                        "project_key": project_key, 
-                        "date": date,
-                        "fetch_worklogs": True
-                    })
-                    jira_raw_content = jira_resp.content[0].text
-                    
-                    if not jira_raw_content.startswith("Error") and "No Jira activity" not in jira_raw_content:
-                        try:
-                            jira_entries = json.loads(jira_raw_content)
-                            if isinstance(jira_entries, list):
-                                daily_jira_entries = jira_entries
-                        except json.JSONDecodeError:
-                            pass
-                except Exception as e:
-                    jira_raw_content = f"Error: {str(e)}"
-
-                # --- Fetch GitHub Data ---
-                github_raw_content = ""
-                daily_github_entries = []
-                try:
-                    github_resp = await session.call_tool("get_github_activity", arguments={
-                        "username": github_user, 
-                        "date": date
-                    })
-                    github_raw_content = github_resp.content[0].text
-                    
-                    if not github_raw_content.startswith("Error") and "No GitHub activity" not in github_raw_content:
-                        try:
-                            github_entries = json.loads(github_raw_content)
-                            if isinstance(github_entries, list):
-                                daily_github_entries = github_entries
-                        except:
-                            pass
-                except Exception as e:
-                   github_raw_content = f"Error: {str(e)}"
-
-                # --- Save Raw Data ---
-                try:
-                    with open(f"logs/activity_{date}.json", "w") as f:
-                        json.dump({
-                            "date": date,
-                            "jira": daily_jira_entries,
-                            "github": daily_github_entries,
-                            "raw_jira_response": jira_raw_content,
-                            "raw_github_response": github_raw_content
-                        }, f, indent=2)
-                except Exception as e:
-                    print(f"Failed to save log for {date}: {e}", file=sys.stderr)
-
-                # --- Select Best Task ---
-                selected_entry = None
-                if daily_jira_entries:
-                    # Prioritize: Done/Completed > In Progress > Others
-                    def get_priority(entry):
-                        status = entry.get("status", "").lower()
-                        if status in ["done", "completed", "verified", "closed", "resolved"]:
-                            return 0
-                        elif status == "in progress":
-                            return 1
-                        else:
-                            return 2
-                    
-                    daily_jira_entries.sort(key=get_priority)
-                    selected_entry = daily_jira_entries[0]
-
-                # --- Prepare LLM Context ---
-                jira_context = ""
-                if selected_entry:
-                    jira_context = f"{selected_entry['key']}: {selected_entry['summary']}\nDescription: {selected_entry.get('description', '')[:500]}"
-                
-                github_context = ""
-                if daily_github_entries:
-                    github_context = "\n".join([f"- {i['summary']}" for i in daily_github_entries])
-
-                # --- Generate Summary ---
-                daily_summary = ""
-                if selected_entry or github_context:
-                    daily_summary = summarize_activity(jira_context, github_context, date)
-
-                # --- Calculate Logged Hours ---
-                daily_logged_hours, has_worklogs = aggregate_daily_logged_hours(
-                    daily_jira_entries, 
-                    date, 
-                    credentials.get("EMPLOYEE_NAME", ""), 
-                    credentials.get("JIRA_EMAIL", "")
-                )
-
-                try:
-                    default_hours = float(credentials.get("AUTHORIZED_HOURS", 8))
-                except (ValueError, TypeError):
-                    default_hours = 8.0
-
-                if has_worklogs:
-                    # Logged Hours (Jira Worklogs) override default
-                    planned_hours = daily_logged_hours
-                    balance_hours = max(0.0, default_hours - planned_hours)
-                else:
-                    planned_hours = default_hours
-                    balance_hours = 0.0
-
-                # --- Create Timesheet Row ---
-                if selected_entry:
-                    timesheet_data.append({
-                        "Date": date,
-                        "Project": selected_entry.get("project", project_key),
-                        "Task": selected_entry.get("summary"),
-                        "Task Description": selected_entry.get("description", ""),
-                        "Status": selected_entry.get("status"),
-                        "Remark": daily_summary,
-                        "Planned Hours": planned_hours,      # Logged Hours (Jira Worklogs)
-                        "Balance Hours": balance_hours
-                    })
-                elif github_context:
-                    # Fallback if no Jira but GitHub activity exists
-                    timesheet_data.append({
-                        "Date": date,
-                        "Project": "GitHub/General",
-                        "Task": "General Development Activities",
-                        "Task Description": "See Remarks for details.",
-                        "Status": "Completed", 
-                        "Remark": daily_summary,
-                        "Planned Hours": planned_hours,      # Logged Hours (Jira Worklogs)
-                        "Balance Hours": balance_hours
-                    })
-                else:
-                    # NO ACTIVITY FOUND
-                    timesheet_data.append({
-                        "Date": date,
-                        "Project": "N/A",
-                        "Task": "No activity",
-                        "Task Description": "No Jira or GitHub activity found.",
-                        "Status": "N/A",
-                        "Remark": "No activity recorded.",
-                        "Planned Hours": planned_hours,      # Logged Hours (Jira Worklogs)
-                        "Balance Hours": balance_hours
-                    })
 
-    return timesheet_data
+class PersistentMCPSession:
+    """
+    Keeps one mcp_server.py subprocess and its ClientSession alive across
+    user actions, so repeat fetches skip the subprocess spawn + MCP
+    handshake cost on every click.
+
+    The session lives inside a single long-running coroutine on a dedicated
+    background event loop thread (the stdio transport's context managers
+    must be entered and exited by the same task). Synchronous callers
+    submit work to the loop via run_coroutine_threadsafe.
+    """
+
+    def __init__(self, credentials):
+        self._credentials = dict(credentials)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self._session = None
+        self._shutdown = None
+        self._ready = None
+        self._runner_future = None
+
+    async def _runner(self):
+        self._shutdown = asyncio.Event()
+        try:
+            async with stdio_client(_server_params(self._credentials)) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    self._session = session
+                    self._ready.set_result(True)
+                    await self._shutdown.wait()
+        except BaseException as e:
+            if not self._ready.done():
+                self._ready.set_exception(e)
+        finally:
+            self._session = None
+
+    def start(self):
+        import concurrent.futures
+        self._ready = concurrent.futures.Future()
+        self._runner_future = asyncio.run_coroutine_threadsafe(self._runner(), self._loop)
+        self._ready.result(timeout=60)
+
+    def collect(self, start_date, end_date):
+        if self._session is None:
+            raise RuntimeError("MCP session is not running")
+        return asyncio.run_coroutine_threadsafe(
+            _collect_timesheet(self._session, self._credentials, start_date, end_date),
+            self._loop
+        ).result()
+
+    def close(self):
+        try:
+            if self._shutdown is not None:
+                self._loop.call_soon_threadsafe(self._shutdown.set)
+            if self._runner_future is not None:
+                self._runner_future.result(timeout=10)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+class _InProcessSession:
+    """
+    Duck-types the slice of ClientSession the fetch helpers use, but
+    dispatches straight to the mcp_server tool implementations in this
+    process — no subprocess spawn, no MCP handshake, no pipe traffic.
+    Tool results are wrapped to look like MCP text content.
+    """
+
+    def __init__(self, credentials):
+        # The tool implementations read credentials from the environment
+        # at call time, same as the subprocess path's injected env.
+        os.environ.update(credentials)
+
+    async def call_tool(self, name, arguments):
+        import mcp_server
+        from types import SimpleNamespace
+        impl = {
+            "get_jira_activity": mcp_server.get_jira_activity_impl,
+            "get_github_activity": mcp_server.get_github_activity_impl,
+        }[name]
+        result = await asyncio.to_thread(impl, **arguments)
+        if orjson is not None:
+            text = orjson.dumps(result).decode()
+        else:
+            text = json.dumps(result)
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+# One persistent session per distinct credential set.
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _session_key(credentials):
+    return tuple(sorted(credentials.items()))
+
+
+def _get_persistent_session(credentials):
+    key = _session_key(credentials)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = PersistentMCPSession(credentials)
+            session.start()
+            _sessions[key] = session
+        return session
+
+
+def _drop_persistent_session(credentials):
+    key = _session_key(credentials)
+    with _sessions_lock:
+        session = _sessions.pop(key, None)
+    if session is not None:
+        session.close()
 
 
 def get_data(credentials, start_date=None, end_date=None):
@@ -255,33 +458,77 @@ def get_data(credentials, start_date=None, end_date=None):
         end_date = datetime.now().date()
         start_date = end_date - timedelta(days=5)
 
-    data = asyncio.run(fetch_timesheet_data(credentials, start_date, end_date))
-    
+    # The server tools live in this repo, so the fast path calls them
+    # in-process; the subprocess paths remain as fallbacks (e.g. if the
+    # in-process import or a tool dependency fails).
+    try:
+        data = asyncio.run(_collect_timesheet(
+            _InProcessSession(credentials), credentials, start_date, end_date
+        ))
+    except Exception as inproc_err:
+        print(f"In-process MCP tools failed, falling back to subprocess: {inproc_err}", file=sys.stderr)
+        try:
+            session = _get_persistent_session(credentials)
+            data = session.collect(start_date, end_date)
+        except Exception as e:
+            # The session (or its subprocess) may have died; drop it and fall
+            # back to a one-shot run so the user's action still succeeds.
+            print(f"Persistent MCP session failed, falling back to one-shot run: {e}", file=sys.stderr)
+            try:
+                _drop_persistent_session(credentials)
+            except Exception:
+                pass
+            data = asyncio.run(fetch_timesheet_data(credentials, start_date, end_date))
+
     # Sort by Date descending (newest first) for display
     data.sort(key=lambda x: x['Date'], reverse=True)
-        
+
     return data
 
+@functools.lru_cache(maxsize=64)
 def _normalize_jira_status(status: str) -> str:
+    # A project has a handful of distinct statuses, so each unique string
+    # pays for strip/lower once per run instead of once per entry.
     return (status or "").strip().lower()
 
-def _load_logs_in_range(start_date, end_date):
-    dates = get_dates_in_range(start_date, end_date)
+# Parsed activity logs keyed by path, invalidated on mtime change, so
+# repeated insights runs don't re-decode the same JSON files.
+_LOG_CACHE = {}
+
+def _load_log(path):
+    mtime = os.stat(path).st_mtime
+    cached = _LOG_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    if orjson is not None:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(path, "r") as f:
+            data = json.load(f)
+    _LOG_CACHE[path] = (mtime, data)
+    return data
+
+def _load_logs_in_range(start_date, end_date, dates=None):
+    if dates is None:
+        dates = get_dates_in_range(start_date, end_date)
     logs = []
     for date_str in dates:
         log_file = f"logs/activity_{date_str}.json"
-        if os.path.exists(log_file):
-            try:
-                with open(log_file, "r") as f:
-                    data = json.load(f)
-                    data['date'] = date_str
-                    logs.append(data)
-            except Exception:
-                continue
+        try:
+            data = dict(_load_log(log_file))
+            data['date'] = date_str
+            logs.append(data)
+        except Exception:
+            continue
     return logs
 
 def generate_productivity_insights(start_date, end_date) -> dict:
-    logs = _load_logs_in_range(start_date, end_date)
+    # One date-range materialization shared by the loader and the loop.
+    dates = get_dates_in_range(start_date, end_date)
+    logs = _load_logs_in_range(start_date, end_date, dates=dates)
+    # O(1) lookups per date below instead of a linear scan of the list.
+    logs_by_date = {l.get('date'): l for l in logs}
     
     total_commits = 0
     commits_per_day = {}
@@ -299,13 +546,11 @@ def generate_productivity_insights(start_date, end_date) -> dict:
     longest_inactivity_streak = 0
     
     context_switching_days = []
-    
-    dates = get_dates_in_range(start_date, end_date)
-    
+
     for date_str in dates:
         commits_per_day[date_str] = 0
         
-        day_log = next((l for l in logs if l.get('date') == date_str), None)
+        day_log = logs_by_date.get(date_str)
         
         if not day_log:
             inactivity_streak += 1
@@ -354,18 +599,18 @@ def generate_productivity_insights(start_date, end_date) -> dict:
             
     total_jira_touched = len(in_progress_durations)
     
-    completed_statuses = {"done", "closed", "resolved", "verified", "completed"}
     in_progress_times = []
-    
+
     for key, data in in_progress_durations.items():
         statuses = data['statuses']
-        if any(s in completed_statuses for s in statuses):
+        # isdisjoint runs the membership test in C, no Python generator
+        if not statuses.isdisjoint(_DONE_STATUSES):
             tickets_completed += 1
         elif "in progress" in statuses:
             tickets_in_progress += 1
             
-        first_date = datetime.strptime(data['first_seen'], "%Y-%m-%d").date()
-        last_date = datetime.strptime(data['last_seen'], "%Y-%m-%d").date()
+        first_date = date_type.fromisoformat(data['first_seen'])
+        last_date = date_type.fromisoformat(data['last_seen'])
         days_active = (last_date - first_date).days + 1
         in_progress_times.append(days_active)
         
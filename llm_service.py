@@ -1,3 +1,6 @@
+import hashlib
+import os
+
 import config
 # from openai import AzureOpenAI
 from groq import Groq
@@ -15,10 +18,49 @@ llm_client = None
 if config.GROQ_API_KEY:
     llm_client = Groq(api_key=config.GROQ_API_KEY)
 
+# Summaries are deterministic from their inputs, so cache them by content
+# hash: an in-process dict for the current run plus text files under
+# logs/.summary_cache/ so reruns and backfills skip the LLM entirely.
+_SUMMARY_CACHE_DIR = os.path.join("logs", ".summary_cache")
+_summary_memory_cache = {}
+
+def _summary_key(jira_content: str, github_content: str, date: str) -> str:
+    payload = f"{jira_content}\x1f{github_content}\x1f{date}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
 def summarize_activity(jira_content: str, github_content: str, date: str) -> str:
     """
     Summarizes the daily activity using the configured LLM.
+    Results are cached by content hash in memory and on disk.
     """
+    key = _summary_key(jira_content, github_content, date)
+    cached = _summary_memory_cache.get(key)
+    if cached is not None:
+        return cached
+
+    cache_path = os.path.join(_SUMMARY_CACHE_DIR, f"{key}.txt")
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            summary = f.read()
+        _summary_memory_cache[key] = summary
+        return summary
+    except OSError:
+        pass
+
+    summary = _summarize_uncached(jira_content, github_content, date)
+
+    # Only persist real summaries; error fallbacks should retry next run.
+    if not summary.startswith("LLM"):
+        _summary_memory_cache[key] = summary
+        try:
+            os.makedirs(_SUMMARY_CACHE_DIR, exist_ok=True)
+            with open(cache_path, "w", encoding="utf-8") as f:
+                f.write(summary)
+        except OSError:
+            pass
+    return summary
+
+def _summarize_uncached(jira_content: str, github_content: str, date: str) -> str:
     if not llm_client:
         print("Groq API key not configured, skipping summarization.")
         return "LLM not configured. Raw Data gathered."
@@ -56,7 +98,7 @@ def summarize_activity(jira_content: str, github_content: str, date: str) -> str
                 {"role": "system", "content": "You are a helpful assistant that summarizes work activity for timesheets."},
                 {"role": "user", "content": prompt}
             ],
-            max_tokens=150
+            max_tokens=80  # a single concise paragraph; anything longer is trimmed by the prompt anyway
         )
         return response.choices[0].message.content.strip()
     except Exception as e:
@@ -1,7 +1,10 @@
 import asyncio
-from datetime import datetime, timedelta
+from datetime import date as date_type, datetime, timedelta
+import json
+import logging
 import os
 import sys
+import time
 import httpx
 from mcp.server.fastmcp import FastMCP
 from dotenv import load_dotenv
@@ -12,135 +15,514 @@ load_dotenv()
 # Initialize FastMCP
 mcp = FastMCP("Timesheet Data Fetcher")
 
-# Configuration
-JIRA_URL = os.getenv("JIRA_URL")
-JIRA_EMAIL = os.getenv("JIRA_EMAIL")
-JIRA_API_TOKEN = os.getenv("JIRA_API_TOKEN")
-GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+# Debug chatter goes through logging instead of raw stderr writes:
+# with the default INFO level each suppressed call costs a level check
+# rather than an f-string build plus a blocking write() syscall.
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+log = logging.getLogger("mcp_server")
+
+# Credentials are read from the environment at call time (see the
+# *_impl functions) so in-process callers can update them between calls.
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj) -> str:
+    """Serializes a tool result, via orjson's C encoder when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+def _loads_response(resp):
+    """
+    Decodes an httpx response body. orjson parses the raw bytes directly,
+    skipping response.json()'s charset sniff and intermediate str.
+    """
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+# Tool results keyed by their arguments: retries and re-runs for the
+# same day are served from memory instead of burning rate limit.
+# Historical dates are effectively immutable, so they keep much longer.
+_TOOL_CACHE = {}
+_TOOL_CACHE_TTL = 120
+_TOOL_CACHE_TTL_HISTORICAL = 12 * 3600
+
+def _tool_cache_get(key):
+    entry = _TOOL_CACHE.get(key)
+    if entry is not None and entry[0] > time.time():
+        return entry[1]
+    return None
+
+def _tool_cache_put(key, date_str, result):
+    # Error results are never cached so transient failures retry.
+    if isinstance(result, dict) and "error" in result:
+        return
+    try:
+        historical = datetime.strptime(date_str, "%Y-%m-%d").date() < datetime.now().date()
+    except ValueError:
+        historical = False
+    ttl = _TOOL_CACHE_TTL_HISTORICAL if historical else _TOOL_CACHE_TTL
+    _TOOL_CACHE[key] = (time.time() + ttl, result)
+
+# Jira/GitHub clients are reused across tool calls (one auth handshake
+# per credential set, not per call); they're rebuilt if credentials change.
+_jira_client = None
+_jira_client_key = None
+_github_client = None
+_github_client_key = None
+
+def _get_jira_client(url, email, token):
+    global _jira_client, _jira_client_key
+    from jira import JIRA
+    key = (url, email, token)
+    if _jira_client is None or _jira_client_key != key:
+        _jira_client = JIRA(server=url, basic_auth=(email, token))
+        _jira_client_key = key
+    return _jira_client
+
+def _get_github_client(token):
+    global _github_client, _github_client_key
+    from github import Github
+    if _github_client is None or _github_client_key != token:
+        _github_client = Github(token)
+        _github_client_key = token
+    return _github_client
+
+def get_jira_activity_impl(project_key: str, date: str, fetch_worklogs: bool = False,
+                           include_description: bool = True):
+    """
+    Pure-Python implementation of get_jira_activity: returns a list of
+    issue dicts (or an error dict) so in-process callers skip the JSON
+    round-trip that the MCP tool wrapper adds for external clients.
+    Credentials are read from the environment at call time.
+    include_description=False drops the heaviest field from the search
+    response for consumers that only need summaries.
+    """
+
+    jira_url = os.getenv("JIRA_URL")
+    jira_email = os.getenv("JIRA_EMAIL")
+    jira_api_token = os.getenv("JIRA_API_TOKEN")
+
+    if not jira_url or not jira_api_token:
+        return {"error": "Jira credentials not configured."}
+
+    cache_key = ("jira", project_key, date, fetch_worklogs, include_description)
+    cached = _tool_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        # Validate the date client-side and query a proper half-open
+        # interval [date, date+1d): the old "< '{date} 23:59'" bound
+        # silently dropped anything updated in the final minute.
+        day = date_type.fromisoformat(date)
+        next_day = day + timedelta(days=1)
+        jira = _get_jira_client(jira_url, jira_email, jira_api_token)
+        jql = (f"project = {project_key} AND updated >= '{day.isoformat()}' "
+               f"AND updated < '{next_day.isoformat()}'")
+        issues_list = _search_issue_dicts(jira, jql, fetch_worklogs, include_description)
+        _tool_cache_put(cache_key, date, issues_list)
+        return issues_list
+    except Exception as e:
+        return {"error": f"Error fetching Jira data: {str(e)}"}
+
+def _search_issue_dicts(jira, jql, fetch_worklogs, include_description):
+    """
+    Runs a paginated JQL search and flattens the results into the plain
+    issue dicts both Jira tools return.
+    """
+    # Searching issues; asking for the worklog field up front returns
+    # embedded worklogs in the same HTTP call instead of one extra
+    # request per issue (the N+1 pattern).
+    fields = "summary,status,updated,assignee,project"
+    if include_description:
+        fields += ",description"
+    if fetch_worklogs:
+        fields += ",worklog"
+    # Page through the results (100 per request, the API maximum)
+    # instead of silently dropping everything past the first 50 on
+    # busy days. The cap is a safety valve for pathological JQL.
+    issues = []
+    start_at = 0
+    while start_at < 500:
+        page = jira.search_issues(jql, startAt=start_at, maxResults=100, fields=fields)
+        issues.extend(page)
+        if not page or len(issues) >= getattr(page, 'total', len(issues)):
+            break
+        start_at += len(page)
+
+    issues_list = []
+    for issue in issues:
+        key = issue.key
+        summary = issue.fields.summary if hasattr(issue.fields, 'summary') else ""
+        status = issue.fields.status.name if hasattr(issue.fields, 'status') and issue.fields.status else ""
+        project_name = issue.fields.project.name if hasattr(issue.fields, 'project') and issue.fields.project else ""
+        
+        description_text = ""
+        if include_description:
+            desc_raw = issue.fields.description if hasattr(issue.fields, 'description') else ""
+            description_text = str(desc_raw) if desc_raw else ""
+        
+        assignee_obj = issue.fields.assignee if hasattr(issue.fields, 'assignee') else None
+        assignee_name = assignee_obj.displayName if assignee_obj else "Unassigned"
+        updated = issue.fields.updated if hasattr(issue.fields, 'updated') else ""
+
+        worklogs_list = []
+        if fetch_worklogs:
+            try:
+                wl_field = getattr(issue.fields, 'worklog', None)
+                worklogs = list(wl_field.worklogs) if wl_field else []
+                # Search results embed only the first page of worklogs;
+                # fall back to the per-issue endpoint when truncated.
+                if wl_field and getattr(wl_field, 'total', 0) > len(worklogs):
+                    worklogs = jira.worklogs(issue.id)
+                for wl in worklogs:
+                    author_name = wl.author.displayName if hasattr(wl, 'author') and hasattr(wl.author, 'displayName') else "Unknown"
+                    author_email = wl.author.emailAddress if hasattr(wl, 'author') and hasattr(wl.author, 'emailAddress') else ""
+                    started_full = wl.started if hasattr(wl, 'started') else ""
+                    started_date = started_full[:10] if started_full else ""
+                    time_spent_sec = wl.timeSpentSeconds if hasattr(wl, 'timeSpentSeconds') else 0
+                    
+                    worklogs_list.append({
+                        "author": author_name,
+                        "author_email": author_email,
+                        "date": started_date,
+                        "time_spent_seconds": time_spent_sec
+                    })
+            except Exception as wl_err:
+                log.debug("Error fetching worklog for %s: %s", key, wl_err)
+
+        issues_list.append({
+            "key": key,
+            "summary": summary,
+            "status": status,
+            "description": description_text,
+            "assignee_name": assignee_name,
+            "project": project_name,
+            "updated": updated,
+            "worklogs": worklogs_list
+        })
+        
+    return issues_list
 
 @mcp.tool()
-def get_jira_activity(project_key: str, date: str, fetch_worklogs: bool = False) -> str:
+def get_jira_activity(project_key: str, date: str, fetch_worklogs: bool = False,
+                      include_description: bool = True) -> str:
     """
     Fetches Jira issues updated on a specific date for a given project.
     Optionally fetches worklogs for each issue.
     Returns a JSON string of list of dicts.
-    
+
     Args:
         project_key: The Jira project key (e.g., 'PROJ').
         date: The date to filter by (YYYY-MM-DD).
+        fetch_worklogs: Whether to include per-issue worklogs.
+        include_description: Set False to omit the (large) description field.
     """
-    import json
-    import sys
-    from jira import JIRA
+    return _dumps(get_jira_activity_impl(project_key, date, fetch_worklogs, include_description))
 
-    if not JIRA_URL or not JIRA_API_TOKEN:
-        return json.dumps({"error": "Jira credentials not configured."})
+def get_jira_activity_for_user_impl(date: str, projects=None, fetch_worklogs: bool = False,
+                                    include_description: bool = True):
+    """
+    Cross-project variant of get_jira_activity_impl: one JQL over all of
+    the authenticated user's issues (optionally scoped to a project
+    list), so a caller covering several projects issues one request
+    instead of one per project.
+    """
 
-    try:
-        jira = JIRA(server=JIRA_URL, basic_auth=(JIRA_EMAIL, JIRA_API_TOKEN))
-        jql = f"project = {project_key} AND updated >= '{date}' AND updated < '{date} 23:59'"
-        
-        # Searching issues
-        fields = "summary,status,updated,description,assignee,project"
-        issues = jira.search_issues(jql, maxResults=50, fields=fields)
-        
-        issues_list = []
-        for issue in issues:
-            key = issue.key
-            summary = issue.fields.summary if hasattr(issue.fields, 'summary') else ""
-            status = issue.fields.status.name if hasattr(issue.fields, 'status') and issue.fields.status else ""
-            project_name = issue.fields.project.name if hasattr(issue.fields, 'project') and issue.fields.project else ""
-            
-            desc_raw = issue.fields.description if hasattr(issue.fields, 'description') else ""
-            description_text = str(desc_raw) if desc_raw else ""
-            
-            assignee_obj = issue.fields.assignee if hasattr(issue.fields, 'assignee') else None
-            assignee_name = assignee_obj.displayName if assignee_obj else "Unassigned"
-            updated = issue.fields.updated if hasattr(issue.fields, 'updated') else ""
+    jira_url = os.getenv("JIRA_URL")
+    jira_email = os.getenv("JIRA_EMAIL")
+    jira_api_token = os.getenv("JIRA_API_TOKEN")
 
-            worklogs_list = []
-            if fetch_worklogs:
-                try:
-                    worklogs = jira.worklogs(issue.id)
-                    for wl in worklogs:
-                        author_name = wl.author.displayName if hasattr(wl, 'author') and hasattr(wl.author, 'displayName') else "Unknown"
-                        author_email = wl.author.emailAddress if hasattr(wl, 'author') and hasattr(wl.author, 'emailAddress') else ""
-                        started_full = wl.started if hasattr(wl, 'started') else ""
-                        started_date = started_full[:10] if started_full else ""
-                        time_spent_sec = wl.timeSpentSeconds if hasattr(wl, 'timeSpentSeconds') else 0
-                        
-                        worklogs_list.append({
-                            "author": author_name,
-                            "author_email": author_email,
-                            "date": started_date,
-                            "time_spent_seconds": time_spent_sec
-                        })
-                except Exception as wl_err:
-                    print(f"DEBUG: Error fetching worklog for {key}: {wl_err}", file=sys.stderr)
-
-            issues_list.append({
-                "key": key,
-                "summary": summary,
-                "status": status,
-                "description": description_text,
-                "assignee_name": assignee_name,
-                "project": project_name,
-                "updated": updated,
-                "worklogs": worklogs_list
-            })
-            
-        return json.dumps(issues_list)
+    if not jira_url or not jira_api_token:
+        return {"error": "Jira credentials not configured."}
+
+    project_scope = tuple(projects) if projects else None
+    cache_key = ("jira_user", project_scope, date, fetch_worklogs, include_description)
+    cached = _tool_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        day = date_type.fromisoformat(date)
+        next_day = day + timedelta(days=1)
+        jira = _get_jira_client(jira_url, jira_email, jira_api_token)
+        scope = f"project in ({', '.join(project_scope)}) AND " if project_scope else ""
+        jql = (f"{scope}assignee = currentUser() AND updated >= '{day.isoformat()}' "
+               f"AND updated < '{next_day.isoformat()}'")
+        issues_list = _search_issue_dicts(jira, jql, fetch_worklogs, include_description)
+        _tool_cache_put(cache_key, date, issues_list)
+        return issues_list
     except Exception as e:
-        return json.dumps({"error": f"Error fetching Jira data: {str(e)}"})
+        return {"error": f"Error fetching Jira data: {str(e)}"}
 
 @mcp.tool()
-def get_github_activity(username: str, date: str) -> str:
+def get_jira_activity_for_user(date: str, projects: list[str] | None = None,
+                               fetch_worklogs: bool = False,
+                               include_description: bool = True) -> str:
     """
-    Fetches GitHub activity for a user across all repositories on a specific date.
-    Returns JSON string.
-    
+    Fetches the authenticated user's Jira issues updated on a specific
+    date across all projects (or a given project list) in a single
+    query. Returns a JSON string of list of dicts.
+
     Args:
-        username: The GitHub username.
         date: The date to filter by (YYYY-MM-DD).
+        projects: Optional list of project keys to scope the search.
+        fetch_worklogs: Whether to include per-issue worklogs.
+        include_description: Set False to omit the (large) description field.
     """
-    import json
-    import sys
-    from github import Github
-    
-    if not GITHUB_TOKEN:
-        return json.dumps({"error": "GitHub token not configured."})
+    return _dumps(get_jira_activity_for_user_impl(date, projects, fetch_worklogs, include_description))
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+ETAG_STORE_PATH = os.path.join(".cache", "github_etags.json")
+
+# One httpx.Client shared across tool calls: connections (TCP+TLS) to
+# api.github.com are kept alive instead of re-handshaken per call.
+_http = None
+
+def _http_client():
+    global _http
+    if _http is None or _http.is_closed:
+        try:
+            # HTTP/2 multiplexes concurrent GitHub requests over one
+            # TLS connection; fewer sockets, no extra handshakes.
+            _http = httpx.Client(timeout=30.0, http2=True)
+        except ImportError:
+            # h2 not installed; HTTP/1.1 with keep-alive still reuses
+            # the connection pool.
+            _http = httpx.Client(timeout=30.0)
+    return _http
+
+def _request_with_backoff(send, max_attempts=4):
+    """
+    Calls send() (a zero-arg closure issuing one httpx request) and retries
+    on 403/429/5xx with exponential backoff (1s, 2s, 4s...). Honors
+    Retry-After and, when the rate limit is exhausted, waits for the
+    advertised reset (capped at 60s). Returns the last response.
+    """
+    delay = 1.0
+    resp = None
+    for attempt in range(max_attempts):
+        resp = send()
+        if resp.status_code not in (403, 429) and resp.status_code < 500:
+            return resp
+        if attempt == max_attempts - 1:
+            break
+
+        retry_after = resp.headers.get("Retry-After")
+        sleep_for = float(retry_after) if retry_after and retry_after.isdigit() else delay
+        if resp.headers.get("X-RateLimit-Remaining") == "0":
+            reset = resp.headers.get("X-RateLimit-Reset")
+            if reset and reset.isdigit():
+                sleep_for = max(sleep_for, min(int(reset) - time.time(), 60))
+        log.debug("GitHub returned %s, retrying in %.0fs", resp.status_code, sleep_for)
+        time.sleep(max(sleep_for, 0))
+        delay *= 2
+    return resp
+
+def _load_etag_store() -> dict:
+    try:
+        with open(ETAG_STORE_PATH, "r") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+def _save_etag_store(store: dict) -> None:
+    try:
+        os.makedirs(os.path.dirname(ETAG_STORE_PATH), exist_ok=True)
+        with open(ETAG_STORE_PATH, "w") as f:
+            json.dump(store, f)
+    except Exception:
+        pass  # ETag persistence is best-effort
+
+def _github_events_rest(username: str) -> list:
+    """
+    Fetches the user's recent events with an ETag conditional request.
+    A 304 response reuses the cached body and doesn't count against the
+    REST rate limit. The store is disk-backed because this server is
+    respawned per fetch.
+    """
+    url = f"https://api.github.com/users/{username}/events?per_page=100"
+    headers = {
+        "Authorization": f"token {os.getenv('GITHUB_TOKEN')}",
+        "Accept": "application/vnd.github+json"
+    }
+    store = _load_etag_store()
+    cached = store.get(url)
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    client = _http_client()
+    resp = _request_with_backoff(lambda: client.get(url, headers=headers))
+
+    if resp.status_code == 304 and cached:
+        return cached.get("body", [])
+
+    resp.raise_for_status()
+    events = _loads_response(resp)
+    etag = resp.headers.get("ETag")
+    if etag:
+        store[url] = {"etag": etag, "body": events}
+        _save_etag_store(store)
+    return events
+
+def _github_graphql_activity(username: str, date: str) -> list:
+    """
+    Fetches a user's commits and PRs for one day via the GraphQL API.
+    Two round-trips total (contributions overview + batched commit history)
+    instead of paging the REST events and search endpoints per item.
+    Returns a list of activity dicts; raises on any API/parse failure so the
+    caller can fall back to the REST path.
+    """
+    start = f"{date}T00:00:00Z"
+    end = f"{date}T23:59:59Z"
+    headers = {"Authorization": f"bearer {os.getenv('GITHUB_TOKEN')}"}
+
+    overview_query = """
+    query($login: String!, $from: DateTime!, $to: DateTime!) {
+      user(login: $login) {
+        id
+        contributionsCollection(from: $from, to: $to) {
+          commitContributionsByRepository(maxRepositories: 25) {
+            repository { nameWithOwner }
+          }
+          pullRequestContributions(first: 50) {
+            nodes {
+              pullRequest { title url repository { nameWithOwner } }
+            }
+          }
+        }
+      }
+    }
+    """
+
+    activity_list = []
+    client = _http_client()
+    resp = _request_with_backoff(lambda: client.post(GITHUB_GRAPHQL_URL, headers=headers, json={
+        "query": overview_query,
+        "variables": {"login": username, "from": start, "to": end}
+    }))
+    resp.raise_for_status()
+    payload = _loads_response(resp)
+    if payload.get("errors"):
+        raise RuntimeError(f"GraphQL errors: {payload['errors']}")
+
+    user = payload["data"]["user"]
+    user_id = user["id"]
+    contributions = user["contributionsCollection"]
+
+    for pr_node in contributions["pullRequestContributions"]["nodes"]:
+        pr = pr_node.get("pullRequest") or {}
+        title = pr.get("title", "")
+        pr_url = pr.get("url", "")
+        repo_name = (pr.get("repository") or {}).get("nameWithOwner", "unknown")
+        activity_list.append({
+            "type": "PullRequestEvent",
+            "repo": repo_name,
+            "summary": f"PR: {title}",
+            "key": pr_url,
+            "description": f"Pull Request: {title}"
+        })
+
+    repos = [
+        c["repository"]["nameWithOwner"]
+        for c in contributions["commitContributionsByRepository"]
+    ]
+    if repos:
+        # One aliased query batches commit history for every touched repo.
+        repo_parts = []
+        for i, full_name in enumerate(repos):
+            owner, name = full_name.split("/", 1)
+            repo_parts.append(
+                f'r{i}: repository(owner: "{owner}", name: "{name}") {{'
+                f' nameWithOwner defaultBranchRef {{ target {{ ... on Commit {{'
+                f' history(since: "{start}", until: "{end}", author: {{id: "{user_id}"}}) {{'
+                f' nodes {{ oid message messageHeadline }} }} }} }} }} }}'
+            )
+        commits_query = "query { " + " ".join(repo_parts) + " }"
+
+        resp = _request_with_backoff(lambda: client.post(GITHUB_GRAPHQL_URL, headers=headers, json={"query": commits_query}))
+        resp.raise_for_status()
+        payload = _loads_response(resp)
+        if payload.get("errors"):
+            raise RuntimeError(f"GraphQL errors: {payload['errors']}")
+
+        for repo_data in payload["data"].values():
+            if not repo_data:
+                continue
+            branch_ref = repo_data.get("defaultBranchRef") or {}
+            target = branch_ref.get("target") or {}
+            for node in (target.get("history") or {}).get("nodes", []):
+                activity_list.append({
+                    "type": "Commit",
+                    "repo": repo_data.get("nameWithOwner", "unknown"),
+                    "key": node.get("oid", ""),
+                    "summary": node.get("messageHeadline", ""),
+                    "description": node.get("message", "")
+                })
+
+    return activity_list
+
+def get_github_activity_impl(username: str, date: str):
+    """
+    Pure-Python implementation of get_github_activity: returns a list of
+    activity dicts (or an error dict) for in-process callers. Credentials
+    are read from the environment at call time.
+    """
+
+    github_token = os.getenv("GITHUB_TOKEN")
+    if not github_token:
+        return {"error": "GitHub token not configured."}
+
+    cache_key = ("github", username, date)
+    cached = _tool_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Preferred path: batched GraphQL (2 round-trips for the whole day).
+    try:
+        activity_list = _github_graphql_activity(username, date)
+        _tool_cache_put(cache_key, date, activity_list)
+        return activity_list
+    except Exception as gql_err:
+        log.debug("GraphQL activity fetch failed, falling back to REST: %s", gql_err)
 
     try:
-        g = Github(GITHUB_TOKEN)
+        g = _get_github_client(github_token)
         activity_list = []
-        user = g.get_user(username)
-        
+
         # 1. Fetch other events (PRs, CreateEvents) using the Events API
+        # (conditional request; a 304 reuses the cached body for free)
         try:
-            events = user.get_events()
-            for event in events:
-                if not event.created_at:
+            for event in _github_events_rest(username):
+                created_at_full = event.get("created_at") or ""
+                created_at = created_at_full[:10]
+                if not created_at:
                     continue
-                created_at = event.created_at.strftime("%Y-%m-%d")
-                
+
                 if created_at == date:
-                    repo_name = event.repo.name if event.repo else "unknown"
-                    event_type = event.type
-                    
+                    repo_name = (event.get("repo") or {}).get("name", "unknown")
+                    event_type = event.get("type")
+                    payload = event.get("payload") or {}
+
                     if event_type == "CreateEvent":
-                        ref_type = event.payload.get("ref_type") if event.payload else ""
-                        ref = event.payload.get("ref", "unknown") if event.payload else "unknown"
+                        ref_type = payload.get("ref_type", "")
+                        ref = payload.get("ref", "unknown")
                         activity_list.append({
                             "type": event_type,
                             "repo": repo_name,
                             "ref": ref,
                             "ref_type": ref_type,
                             "summary": f"Created {ref_type} '{ref}'",
-                            "key": f"create-{ref}-{event.created_at.isoformat()}"
+                            "key": f"create-{ref}-{created_at_full}"
                         })
                     elif event_type == "PullRequestEvent":
-                        action = event.payload.get("action") if event.payload else ""
-                        pr = event.payload.get("pull_request", {}) if event.payload else {}
+                        action = payload.get("action", "")
+                        pr = payload.get("pull_request", {})
                         title = pr.get("title", "")
                         pr_url = pr.get("html_url", "")
                         activity_list.append({
@@ -155,7 +537,7 @@ def get_github_activity(username: str, date: str) -> str:
                     # Events are roughly ordered descending by date
                     break
         except Exception as event_err:
-            print(f"DEBUG: Error fetching events: {event_err}", file=sys.stderr)
+            log.debug("Error fetching events: %s", event_err)
 
         # 2. Fetch commits for the exact date using Search API
         try:
@@ -180,11 +562,24 @@ def get_github_activity(username: str, date: str) -> str:
                     "description": msg
                 })
         except Exception as commit_err:
-            print(f"DEBUG: Error fetching commits: {commit_err}", file=sys.stderr)
+            log.debug("Error fetching commits: %s", commit_err)
 
-        return json.dumps(activity_list)
+        _tool_cache_put(cache_key, date, activity_list)
+        return activity_list
     except Exception as e:
-        return json.dumps({"error": f"Error fetching GitHub data: {str(e)}"})
+        return {"error": f"Error fetching GitHub data: {str(e)}"}
+
+@mcp.tool()
+def get_github_activity(username: str, date: str) -> str:
+    """
+    Fetches GitHub activity for a user across all repositories on a specific date.
+    Returns JSON string.
+
+    Args:
+        username: The GitHub username.
+        date: The date to filter by (YYYY-MM-DD).
+    """
+    return _dumps(get_github_activity_impl(username, date))
 
 if __name__ == "__main__":
     mcp.run()